@@ -28,8 +28,8 @@ if not hasattr(termios, "_POSIX_VDISABLE"):
                       "which is available in Python versions >= 3.13")
 
 import sys
-import copy
-import json
+import functools
+import struct
 
 __all__ = [
     "Stty", "TCSANOW", "TCSADRAIN", "TCSAFLUSH",
@@ -100,6 +100,13 @@ def cc_bytes_to_str(b):
     return None
 
 
+# Memoized versions of the 2 functions above for use by Stty,
+# which only passes them hashable str and bytes values. The
+# caches are bounded since those values come from the user.
+_cc_str_to_bytes = functools.lru_cache(maxsize=256)(cc_str_to_bytes)
+_cc_bytes_to_str = functools.lru_cache(maxsize=256)(cc_bytes_to_str)
+
+
 # Indices for termios attribute list.
 _IFLAG = 0
 _OFLAG = 1
@@ -244,6 +251,11 @@ for n in _r:
     if hasattr(termios, rate):
         _baud_d[n] = getattr(termios, rate)
 
+# This stays a dictionary rather than a list indexed by the
+# termios constants: those are not small consecutive integers
+# everywhere (for example, Linux encodes B57600 and above with
+# the CBAUDEX bit, and on the BSDs each constant equals its rate),
+# so such a list would be mostly empty.
 _baud_d_inverse = {v: k for k, v in _baud_d.items()}
 
 # Example element of _cc_d.items() is ("eof", termios.VEOF)
@@ -259,13 +271,60 @@ _speed_d = {"ispeed": _ISPEED, "ospeed": _OSPEED}
 _winsz_d = {"rows": _ROWS, "cols": _COLS} if _HAVE_WINSZ else {}
 _default_winsize = [24, 80]
 
-# Set of lowercase names of all Stty object
+# Layout of files written by Stty.save(): a header made of a
+# magic string, a format version and the platform (sys.platform,
+# since termios constants differ between platforms), followed by
+# the iflag, oflag, cflag, lflag, ispeed and ospeed fields of the
+# termios attribute list, the termios.NCCS control characters,
+# and the rows and cols fields of winsize.
+_SAVE_MAGIC = b"STTY"
+_SAVE_VERSION = 1
+_SAVE_PLATFORM = sys.platform.encode()[:16]
+_save_header = struct.Struct("=4sB16s")
+_save_struct = struct.Struct(f"{_save_header.format}6Q{termios.NCCS}s2H")
+
+# _byte_table[n] == bytes([n]) for 0 <= n < 256; used for
+# building control character lists without constructing
+# a new bytes object per element.
+_byte_table = tuple(bytes([n]) for n in range(256))
+
+# Attribute kinds; Stty.__getattr__() and Stty.__setattr__()
+# dispatch on these.
+_KIND_BOOL = 0
+_KIND_SYMBOL = 1
+_KIND_SPEED = 2
+_KIND_CC = 3
+_KIND_NONCANON = 4
+_KIND_WINSZ = 5
+
+# Keys of _dispatch are lowercase names of all Stty object
+# attributes available on system; each value is a 2-tuple
+# (kind, payload), where payload is the value of the name in
+# the corresponding one of the dictionaries above. This lets
+# Stty.__setattr__ find an attribute with a single lookup.
+#
+# Example element of _dispatch.items() is
+# ("echo", (_KIND_BOOL, (_LFLAG, termios.ECHO))).
+_dispatch = {}
+for kind, d in [(_KIND_BOOL, _bool_d),
+                (_KIND_SYMBOL, _symbol_d),
+                (_KIND_SPEED, _speed_d),
+                (_KIND_CC, _cc_d),
+                (_KIND_NONCANON, _noncanon_d),
+                (_KIND_WINSZ, _winsz_d)]:
+    for name, payload in d.items():
+        _dispatch[name] = (kind, payload)
+
+# Tuple of lowercase names of all Stty object
 # attributes available on system (strings),
-# excluding "_termios" and "_winsize".
-_available = {
+# excluding "_termios" and "_winsize", and
+# the same names as a frozenset for set
+# arithmetic.
+_available = (
     *_bool_d, *_symbol_d, *_speed_d,
     *_cc_d, *_noncanon_d, *_winsz_d
-}
+)
+_available_set = frozenset(_available)
 
 # Dictionary of all available Stty object
 # attributes, attribute values, and other
@@ -288,12 +347,59 @@ _available_dict["non_canonical"] = set(_noncanon_d)
 _available_dict["speed"] = set(_speed_d)
 _available_dict["winsize"] = set(_winsz_d)
 _available_dict["baud_rates"] = set(_baud_d)
-# This copy is for the user.
-settings = copy.deepcopy(_available_dict)
+# This copy is for the user; values of
+# _available_dict are sets or dictionaries
+# of sets.
+settings = {k: ({kk: set(vv) for kk, vv in v.items()}
+                if isinstance(v, dict) else set(v))
+            for k, v in _available_dict.items()}
+
+# Names of boolean iflag and lflag attributes
+# available on system and the bitwise OR of
+# their masks; turned off by Stty.raw().
+_ifbool_avail = tuple(_available_dict["boolean"]["iflag"])
+_lfbool_avail = tuple(_available_dict["boolean"]["lflag"])
+_ifbool_mask = 0
+for name in _ifbool_avail:
+    _ifbool_mask |= _bool_d[name][1]
+_lfbool_mask = 0
+for name in _lfbool_avail:
+    _lfbool_mask |= _bool_d[name][1]
+
+# Attribute names in the order in which Stty.__repr__()
+# lists them, and the format string that it fills with
+# their values; for example, the "MIN, TIME" line of the
+# format string is "\nMIN, TIME: min={} time={}\n".
+_repr_names = []
+_repr_template = ""
+for l, h in [(_available_dict["boolean"]["iflag"], "iflag bool"),
+             (_available_dict["boolean"]["oflag"], "oflag bool"),
+             (_available_dict["boolean"]["cflag"], "cflag bool"),
+             (_available_dict["boolean"]["lflag"], "lflag bool"),
+             (_available_dict["control_character"], "cc"),
+             (_available_dict["non_canonical"], "min, time"),
+             (["csize"], "csize"),
+             (_available_dict["delay_masks"], "delay masks"),
+             (_available_dict["speed"], "speed"),
+             (_available_dict["winsize"], "winsize")]:
+    names = sorted(l)
+    _repr_names.extend(names)
+    fields = " ".join([f"{x}={{}}" for x in names])
+    _repr_template = f"{_repr_template}\n{h.upper()}: {fields}\n"
+_repr_names = tuple(_repr_names)
+
+# Same for Stty.__str__(), which lists the "name=value"
+# strings in sorted order; the sort key keeps "eol2" in
+# front of "eol" as in that order.
+_str_names = tuple(sorted(_available, key=lambda x: f"{x}="))
+_str_template = ", ".join([f"{x}={{}}" for x in _str_names])
 
 
 class Stty(object):
     """Manipulate termios and winsize in the style of stty(1)."""
+    __slots__ = ("_termios", "_winsize", "_cached_get", "_cached_repr",
+                 "__weakref__", *_available)
+
     def __init__(self, fd=None, path=None, **opts):
         if fd == None and path == None:
             raise ValueError("fd or path must be provided")
@@ -309,182 +415,272 @@ class Stty(object):
 
         self.set(**opts)
 
-    def __setattr__(self, name, value):
-        if name == "_termios" or name == "_winsize":
-            raise AttributeError(f"attribute '{name}' must not be "
-                                 "directly modified")
-
-        if name in _bool_d:
-            if not isinstance(value, bool):
-                raise TypeError(f"value of attribute '{name}' must have "
-                                "type 'bool'")
-
-            x = _bool_d[name]
-            if value:
-                self._termios[x[0]] |= x[1]
-            else:
-                self._termios[x[0]] &= ~x[1]
+    def __getattr__(self, name):
+        # Only called when name is not yet an attribute of self;
+        # _termios and _winsize are authoritative, so derive the
+        # value from them and keep it so that subsequent accesses
+        # find it directly.
+        entry = _dispatch.get(name)
+        if entry is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no "
+                                 f"attribute '{name}'")
 
-            super().__setattr__(name, value)
+        kind, x = entry
+        t = self._termios
+
+        # _termios may hold a symbol, speed or control character
+        # value with no entry in the corresponding table; report
+        # it with the same ValueError that __setattr__() raises.
+        if kind == _KIND_BOOL:
+            value = True if (t[x[0]] & x[1]) else False
+        elif kind == _KIND_SYMBOL:
+            value = x[2].get(t[x[0]] & x[1])
+            if value == None:
+                raise ValueError(f"unsupported value '{t[x[0]] & x[1]}' "
+                                 f"for attribute '{name}'")
+        elif kind == _KIND_SPEED:
+            value = _baud_d_inverse.get(t[x])
+            if value == None:
+                raise ValueError(f"unsupported value '{t[x]}' for "
+                                 f"attribute '{name}'")
+        elif kind == _KIND_CC:
+            value = _cc_bytes_to_str(t[_CC][x])
+            if value == None:
+                raise ValueError(f"unsupported value '{t[_CC][x]}' for "
+                                 f"attribute '{name}'")
+        elif kind == _KIND_NONCANON:
+            value = t[_CC][x]
+            if isinstance(value, bytes):
+                value = value[0]
+        else: # kind == _KIND_WINSZ
+            value = self._winsize[x]
+
+        super().__setattr__(name, value)
+        return value
+
+    def __setattr__(self, name, value):
+        entry = _dispatch.get(name)
+        if entry is None:
+            if name == "_termios" or name == "_winsize":
+                raise AttributeError(f"attribute '{name}' must not be "
+                                     "directly modified")
+
+            raise AttributeError(f"attribute '{name}' unsupported on platform")
+
+        kind, x = entry
+        self._setters[kind](self, name, x, value)
+
+    # Each of the following methods validates value for the
+    # attribute name of its kind, whose _dispatch payload is x,
+    # and applies it. A write that would not change _termios or
+    # _winsize returns early, keeping the caches of get() and
+    # repr().
+
+    def _set_bool(self, name, x, value):
+        if not isinstance(value, bool):
+            raise TypeError(f"value of attribute '{name}' must have "
+                            "type 'bool'")
+
+        # Some masks, like CIBAUD, have more than one bit; only
+        # a flag word that already has all or none of them set
+        # needs no change.
+        if (self._termios[x[0]] & x[1]) == (x[1] if value else 0):
             return
 
-        if name in _symbol_d:
-            if not (isinstance(value, int) or isinstance(value, str)):
-                raise TypeError(f"value of attribute '{name}' must have "
-                                "type 'int' or 'str'")
+        if value:
+            self._termios[x[0]] |= x[1]
+        else:
+            self._termios[x[0]] &= ~x[1]
 
-            x = _symbol_d[name] # 4-tuple
+        self._drop_cache()
+        super().__setattr__(name, value)
 
-            if isinstance(value, int):
-                if value not in x[2]:
-                    raise ValueError(f"unsupported value '{value}' for "
-                                     f"attribute '{name}'")
+    def _set_symbol(self, name, x, value):
+        if not (isinstance(value, int) or isinstance(value, str)):
+            raise TypeError(f"value of attribute '{name}' must have "
+                            "type 'int' or 'str'")
 
-                value_as_int = value
-                value_as_str = x[2][value]
+        # x is a 4-tuple.
+        if isinstance(value, int):
+            if value not in x[2]:
+                raise ValueError(f"unsupported value '{value}' for "
+                                 f"attribute '{name}'")
 
-            if isinstance(value, str):
-                if value not in x[3]:
-                    raise ValueError(f"unsupported value '{value}' for "
-                                     f"attribute '{name}'")
+            value_as_int = value
+            value_as_str = x[2][value]
 
-                value_as_int = x[3][value]
-                value_as_str = value
+        if isinstance(value, str):
+            if value not in x[3]:
+                raise ValueError(f"unsupported value '{value}' for "
+                                 f"attribute '{name}'")
 
-            self._termios[x[0]] &= ~x[1]
-            self._termios[x[0]] |= value_as_int
+            value_as_int = x[3][value]
+            value_as_str = value
 
-            super().__setattr__(name, value_as_str)
+        if (self._termios[x[0]] & x[1]) == value_as_int:
             return
 
-        if name in _speed_d:
-            if not isinstance(value, int):
-                raise TypeError(f"value of attribute '{name}' must have "
-                                "type 'int'")
+        self._termios[x[0]] &= ~x[1]
+        self._termios[x[0]] |= value_as_int
 
-            if value not in _baud_d:
-                raise ValueError(f"unsupported value {value} for "
-                                 f"attribute '{name}'")
+        self._drop_cache()
+        super().__setattr__(name, value_as_str)
 
-            self._termios[_speed_d[name]] = _baud_d[value]
+    def _set_speed(self, name, x, value):
+        if not isinstance(value, int):
+            raise TypeError(f"value of attribute '{name}' must have "
+                            "type 'int'")
 
-            super().__setattr__(name, value)
+        if value not in _baud_d:
+            raise ValueError(f"unsupported value {value} for "
+                             f"attribute '{name}'")
+
+        if self._termios[x] == _baud_d[value]:
             return
 
-        if name in _cc_d:
-            if not (isinstance(value, str) or isinstance(value, bytes)):
-                raise TypeError(f"value of attribute '{name}' must have "
-                                "type 'str' or 'bytes'")
-
-            if isinstance(value, str):
-                value_as_bytes = cc_str_to_bytes(value)
-                # cc_bytes_to_str() is not a strict inverse of
-                # cc_str_to_bytes(); for example:
-                # cc_bytes_to_str(cc_str_to_bytes("^-")) == "undef"
-                # cc_bytes_to_str(cc_str_to_bytes("^d")) == "D"
-                #
-                # Calling cc_bytes_to_str() here ensures "uniformity
-                # of representation"; for example, "^a" and "^A" both
-                # represent <SOH> in the POSIX manpage of stty(1) and
-                # the cc_bytes_to_str() call here will make sure that
-                # "name" is set to "^A" for either value "^a", "^A" of
-                # the variable "value".
-                value_as_str = cc_bytes_to_str(value_as_bytes)
+        self._termios[x] = _baud_d[value]
+
+        self._drop_cache()
+        super().__setattr__(name, value)
+
+    def _set_cc(self, name, x, value):
+        if not (isinstance(value, str) or isinstance(value, bytes)):
+            raise TypeError(f"value of attribute '{name}' must have "
+                            "type 'str' or 'bytes'")
+
+        if isinstance(value, str):
+            value_as_bytes = _cc_str_to_bytes(value)
+            # cc_bytes_to_str() is not a strict inverse of
+            # cc_str_to_bytes(); for example:
+            # cc_bytes_to_str(cc_str_to_bytes("^-")) == "undef"
+            # cc_bytes_to_str(cc_str_to_bytes("^d")) == "D"
+            #
+            # Calling cc_bytes_to_str() here ensures "uniformity
+            # of representation"; for example, "^a" and "^A" both
+            # represent <SOH> in the POSIX manpage of stty(1) and
+            # the cc_bytes_to_str() call here will make sure that
+            # "name" is set to "^A" for either value "^a", "^A" of
+            # the variable "value".
+            value_as_str = _cc_bytes_to_str(value_as_bytes)
+
+        if isinstance(value, bytes):
+            value_as_bytes = value
+            value_as_str = _cc_bytes_to_str(value_as_bytes)
+
+        if value_as_bytes == None or value_as_str == None:
+            raise ValueError(f"unsupported value '{value}' for "
+                             f"attribute '{name}'")
+
+        if self._termios[_CC][x] == value_as_bytes:
+            return
 
-            if isinstance(value, bytes):
-                value_as_bytes = value
-                value_as_str = cc_bytes_to_str(value_as_bytes)
+        self._termios[_CC][x] = value_as_bytes
 
-            if value_as_bytes == None or value_as_str == None:
-                raise ValueError(f"unsupported value '{value}' for "
+        self._drop_cache()
+        super().__setattr__(name, value_as_str)
+
+    def _set_noncanon(self, name, x, value):
+        if not (isinstance(value, int) or isinstance(value, bytes)):
+            raise TypeError(f"value of attribute '{name}' must have "
+                            "type 'int' or 'bytes'")
+
+        if isinstance(value, int):
+            if value < 0:
+                raise ValueError("expected nonnegative value for "
                                  f"attribute '{name}'")
+            value_as_int = value
 
-            self._termios[_CC][_cc_d[name]] = value_as_bytes
+        if isinstance(value, bytes):
+            if len(value) != 1:
+                raise ValueError(f"expected 1 byte long value for "
+                                 f"attribute '{name}' but got '{value}'")
+            value_as_int = value[0]
 
-            super().__setattr__(name, value_as_str)
+        if self._termios[_CC][x] == value:
             return
 
-        if name in _noncanon_d:
-            if not (isinstance(value, int) or isinstance(value, bytes)):
-                raise TypeError(f"value of attribute '{name}' must have "
-                                "type 'int' or 'bytes'")
+        self._termios[_CC][x] = value
 
-            if isinstance(value, int):
-                if value < 0:
-                    raise ValueError("expected nonnegative value for "
-                                     f"attribute '{name}'")
-                value_as_int = value
+        self._drop_cache()
+        super().__setattr__(name, value_as_int)
 
-            if isinstance(value, bytes):
-                if len(value) != 1:
-                    raise ValueError(f"expected 1 byte long value for "
-                                     f"attribute '{name}' but got '{value}'")
-                value_as_int = value[0]
+    def _set_winsz(self, name, x, value):
+        if not isinstance(value, int):
+            raise TypeError(f"value of attribute '{name}' must have "
+                            "type 'int'")
 
-            self._termios[_CC][_noncanon_d[name]] = value
+        # The fields of struct winsize are unsigned shorts.
+        if not 0 <= value <= 0xffff:
+            raise ValueError(f"expected value between 0 and 65535 for "
+                             f"attribute '{name}'")
 
-            super().__setattr__(name, value_as_int)
+        if self._winsize[x] == value:
             return
 
-        if name in _winsz_d:
-            if not isinstance(value, int):
-                raise TypeError(f"value of attribute '{name}' must have "
-                                "type 'int'")
+        self._winsize[x] = value
 
-            if value < 0:
-                raise ValueError(f"expected nonnegative value for "
-                                 f"attribute '{name}'")
+        self._drop_cache()
+        super().__setattr__(name, value)
 
-            self._winsize[_winsz_d[name]] = value
+    # Indexed by attribute kind; for example,
+    # _setters[_KIND_BOOL] is _set_bool.
+    _setters = (_set_bool, _set_symbol, _set_speed,
+                _set_cc, _set_noncanon, _set_winsz)
 
-            super().__setattr__(name, value)
+    def _drop_cache(self):
+        """Forget the cached results of get() and __repr__()."""
+        # Repeated writes find both caches already empty.
+        if self._cached_get is None and self._cached_repr is None:
             return
 
-        raise AttributeError(f"attribute '{name}' unsupported on platform")
+        super().__setattr__("_cached_get", None)
+        super().__setattr__("_cached_repr", None)
 
     def __repr__(self):
-        ret = ""
-        for l, h in [(_available_dict["boolean"]["iflag"], "iflag bool"),
-                     (_available_dict["boolean"]["oflag"], "oflag bool"),
-                     (_available_dict["boolean"]["cflag"], "cflag bool"),
-                     (_available_dict["boolean"]["lflag"], "lflag bool"),
-                     (_available_dict["control_character"], "cc"),
-                     (_available_dict["non_canonical"], "min, time"),
-                     (["csize"], "csize"),
-                     (_available_dict["delay_masks"], "delay masks"),
-                     (_available_dict["speed"], "speed"),
-                     (_available_dict["winsize"], "winsize")]:
-            L = [f"{x}={getattr(self, x)}" for x in sorted(l)]
-            s = " ".join(L)
-            ret = f"{ret}\n{h.upper()}: {s}\n"
+        if self._cached_repr is not None:
+            return self._cached_repr
 
+        ret = _repr_template.format(*[getattr(self, x)
+                                      for x in _repr_names])
+
+        super().__setattr__("_cached_repr", ret)
         return ret
 
     def __str__(self):
-        return ", ".join(sorted([f"{x}={getattr(self, x)}" for x in _available]))
+        return _str_template.format(*[getattr(self, x) for x in _str_names])
 
     def get(self):
         """Return dictionary of termios and winsize attributes
         available on the system mapped to their respective values.
+        Raise ValueError if a termios value has no name, as does
+        reading that attribute.
         """
-        return {x: getattr(self, x) for x in _available}
+        if self._cached_get is None:
+            super().__setattr__("_cached_get",
+                                {x: getattr(self, x) for x in _available})
+
+        return self._cached_get.copy()
 
     def set(self, **opts):
         """Set multiple attributes as named arguments."""
-        excess = set(opts) - _available
+        if not opts:
+            return
+
+        excess = opts.keys() - _available_set
         if len(excess) > 0:
             raise AttributeError("attributes in the following set are "
                                  f"unsupported on this platform: {excess}")
 
-        for x in opts:
-            self.__setattr__(x, opts[x])
+        setter = self.__setattr__
+        for x, value in opts.items():
+            setter(x, value)
 
     def eq(self, **opts):
         """Return True if all attributes, which are specified
         as named arguments, have values equal to those of the
         corresponding named arguments; return False otherwise.
         """
-        excess = set(opts) - _available
+        excess = opts.keys() - _available_set
         if len(excess) > 0:
             raise AttributeError("attributes in the following set are "
                                  f"unsupported on this platform: {excess}")
@@ -541,12 +737,12 @@ class Stty(object):
                     return False
 
                 if isinstance(value, str):
-                    value_as_bytes = cc_str_to_bytes(value)
-                    value_as_str = cc_bytes_to_str(value_as_bytes)
+                    value_as_bytes = _cc_str_to_bytes(value)
+                    value_as_str = _cc_bytes_to_str(value_as_bytes)
 
                 if isinstance(value, bytes):
                     value_as_bytes = value
-                    value_as_str = cc_bytes_to_str(value_as_bytes)
+                    value_as_str = _cc_bytes_to_str(value_as_bytes)
 
                 if value_as_bytes == None or value_as_str == None:
                     return False
@@ -589,87 +785,130 @@ class Stty(object):
 
         return True
 
+    def _clone(self):
+        """Return a copy of self that shares no mutable state with it."""
+        cls = type(self)
+        new = cls.__new__(cls)
+
+        t = self._termios
+        super(Stty, new).__setattr__("_termios", [t[_IFLAG], t[_OFLAG],
+                                                  t[_CFLAG], t[_LFLAG],
+                                                  t[_ISPEED], t[_OSPEED],
+                                                  list(t[_CC])])
+        super(Stty, new).__setattr__("_winsize",
+                                     list(self._winsize) if self._winsize
+                                     else None)
+
+        # The cached values are immutable or never modified in
+        # place; new derives all other attributes on access.
+        super(Stty, new).__setattr__("_cached_get", self._cached_get)
+        super(Stty, new).__setattr__("_cached_repr", self._cached_repr)
+
+        return new
+
+    def __getstate__(self):
+        return (self._termios, self._winsize)
+
+    def __setstate__(self, state):
+        self._replace(*state)
+
     def save(self, path=None):
-        """Return deep copy of self or save JSON.
+        """Return copy of self or save to file.
         This mimics "stty -g".
         """
         if not path:
-            return copy.deepcopy(self)
-
-        with open(path, "w") as f:
-            json.dump(self.get(), f)
+            return self._clone()
+
+        t = self._termios
+        # Non-canonical "min" and "time" may be integers, which
+        # __setattr__ does not bound, but the file stores 1 byte
+        # for each of them.
+        for name, x in _noncanon_d.items():
+            if isinstance(t[_CC][x], int) and t[_CC][x] > 0xff:
+                raise ValueError(f"value {t[_CC][x]} of attribute '{name}' "
+                                 "does not fit in 1 byte and cannot be saved")
+        cc = bytes([c if isinstance(c, int) else c[0] for c in t[_CC]])
+        winsize = self._winsize if self._winsize else _default_winsize
+
+        # Pack before opening, so that a failure does not
+        # truncate an existing file at path.
+        data = _save_struct.pack(_SAVE_MAGIC, _SAVE_VERSION, _SAVE_PLATFORM,
+                                 *t[:_CC], cc, *winsize)
+
+        with open(path, "wb") as f:
+            f.write(data)
 
         return None
 
     def load(self, path):
-        """Load termios and winsize from JSON file."""
-        if not hasattr(super(), "_termios"):
-            dev_tty_fd = os.open("/dev/tty", os.O_RDWR)
-            super().__setattr__("_termios",
-                                termios.tcgetattr(dev_tty_fd))
-            os.close(dev_tty_fd)
-
-        if _HAVE_WINSZ:
-            if not hasattr(super(), "_winsize"):
-                super().__setattr__("_winsize", _default_winsize)
-        else:
-            super().__setattr__("_winsize", None)
+        """Load termios and winsize from file written by save()."""
+        with open(path, "rb") as f:
+            data = f.read()
+
+        if not data.startswith(_SAVE_MAGIC):
+            raise ValueError(f"file '{path}' was not written by Stty.save(); "
+                             "note that the JSON files written by earlier "
+                             "versions of Stty.save() are not supported")
+
+        if len(data) < _save_header.size:
+            raise ValueError(f"file '{path}' is truncated")
 
-        with open(path, "r") as f:
-            d = json.load(f)
+        _, version, platform = _save_header.unpack_from(data)
+        if version != _SAVE_VERSION:
+            raise ValueError(f"file '{path}' has unsupported format "
+                             f"version {version}")
 
-        deficiency = _available - set(d)
-        if len(deficiency) > 0:
-            raise ValueError("JSON file does not contain the following "
-                             f"necessary attributes: {deficiency}")
+        platform = platform.rstrip(b"\0")
+        if platform != _SAVE_PLATFORM:
+            raise ValueError(f"file '{path}' was written on platform "
+                             f"'{platform.decode(errors='replace')}', not "
+                             f"'{_SAVE_PLATFORM.decode()}'")
+
+        if len(data) != _save_struct.size:
+            raise ValueError(f"file '{path}' is truncated or corrupt")
+
+        fields = _save_struct.unpack(data)[3:]
+        cc = [_byte_table[c] for c in fields[6]]
 
         # This "if" block mimics termios.tcgetattr behavior,
         # which keeps "min" and "time" fields in "bytes"
         # form in Canonical mode and converts them to
-        # integers in Non-Canonical mode; the dictionary "d"
-        # loaded from JSON will have integer "min" and
-        # "time" values (if it was generated using Stty.save
-        # and if it was not subsequently modified
-        # externally).
-        if d.get("icanon"): # Canonical mode.
-            if "min" in d:
-                d["min"] = bytes([d["min"]])
-            if "time" in d:
-                d["time"] = bytes([d["time"]])
-
-        self.set(**d)
+        # integers in Non-Canonical mode.
+        if not (fields[3] & termios.ICANON): # Non-Canonical mode.
+            for x in _noncanon_d.values():
+                cc[x] = cc[x][0]
+
+        self._replace([*fields[:6], cc],
+                      list(fields[7:]) if _HAVE_WINSZ else None)
 
     def fromfd(self, fd):
         """Get settings from terminal."""
-        super().__setattr__("_termios", termios.tcgetattr(fd))
-        if _HAVE_WINSZ:
-            super().__setattr__("_winsize", list(termios.tcgetwinsize(fd)))
-        else:
-            super().__setattr__("_winsize", None)
-
-        for name in _bool_d:
-            x = _bool_d[name]
-            value = True if (self._termios[x[0]] & x[1]) else False
-            self.__setattr__(name, value)
-
-        for name in _symbol_d:
-            x = _symbol_d[name]
-            y = self._termios[x[0]] & x[1]
-            self.__setattr__(name, y)
+        self._replace(termios.tcgetattr(fd),
+                      list(termios.tcgetwinsize(fd)) if _HAVE_WINSZ else None)
 
-        for name in _speed_d:
-            x = self._termios[_speed_d[name]]
-            self.__setattr__(name, _baud_d_inverse[x])
-
-        for name in _cc_d:
-            self.__setattr__(name, self._termios[_CC][_cc_d[name]])
+    def _replace(self, termios_attr, winsize):
+        """Replace _termios and _winsize and forget all attributes
+        derived from them; __getattr__() recomputes each of them
+        on first access.
+        """
+        super().__setattr__("_termios", termios_attr)
+        super().__setattr__("_winsize", winsize)
+
+        if not hasattr(self, "_cached_get"):
+            # A new object has neither caches nor derived
+            # attributes yet.
+            super().__setattr__("_cached_get", None)
+            super().__setattr__("_cached_repr", None)
+            return
 
-        for name in _noncanon_d:
-            self.__setattr__(name, self._termios[_CC][_noncanon_d[name]])
+        self._drop_cache()
 
-        if self._winsize:
-            for name in _winsz_d:
-                self.__setattr__(name, self._winsize[_winsz_d[name]])
+        forget = super().__delattr__
+        for name in _available:
+            try:
+                forget(name)
+            except AttributeError:
+                pass
 
     def tofd(self, fd, when=termios.TCSANOW, apply_termios=True,
              apply_winsize=True):
@@ -695,10 +934,15 @@ class Stty(object):
 
     def raw(self):
         """Set raw combination mode."""
-        for x in _available_dict["boolean"]["iflag"]:
-            self.__setattr__(x, False)
-        for x in _available_dict["boolean"]["lflag"]:
-            self.__setattr__(x, False)
+        self._drop_cache()
+        t = self._termios
+        t[_IFLAG] &= ~_ifbool_mask
+        t[_LFLAG] &= ~_lfbool_mask
+        store = super().__setattr__
+        for x in _ifbool_avail:
+            store(x, False)
+        for x in _lfbool_avail:
+            store(x, False)
         self.set(opost=False, parenb=False,
                  csize=cs8, min=1, time=0)
 
@@ -712,10 +956,10 @@ class Stty(object):
     def ek(self):
         """Set ek combination mode."""
         if hasattr(termios, "CERASE"):
-            self.erase = bytes([termios.CERASE])
+            self.erase = _byte_table[termios.CERASE]
 
         if hasattr(termios, "CKILL"):
-            self.kill = bytes([termios.CKILL])
+            self.kill = _byte_table[termios.CKILL]
 
     def openpty(self, apply_termios=True, apply_winsize=True):
         """Open a new pty pair and apply
@@ -758,68 +1002,76 @@ class Stty(object):
 
         return pid, m, sname
 
-# Print help message about Stty attributes.
+# Help message about Stty attributes.
 
-_settings_lines = []
-
-_settings_lines.append("For details on the following attributes, "
-      "check the manpage of stty(1) on your system.\n")
-
-_settings_lines.append("Stty attributes:\n")
-
-for x, y in [("iflag", "input mode"),
-             ("oflag", "output mode"),
-             ("cflag", "control mode"),
-             ("lflag", "local mode")]:
-    _settings_lines.append(
-        f"  Boolean {y} attributes (possible values: True, False):"
+@functools.cache
+def settings_help_str():
+    """Return help string about all
+    available Stty attributes and
+    their possible values on the
+    current platform.
+    """
+    lines = []
+
+    lines.append("For details on the following attributes, "
+                 "check the manpage of stty(1) on your system.\n")
+
+    lines.append("Stty attributes:\n")
+
+    for x, y in [("iflag", "input mode"),
+                 ("oflag", "output mode"),
+                 ("cflag", "control mode"),
+                 ("lflag", "local mode")]:
+        lines.append(
+            f"  Boolean {y} attributes (possible values: True, False):"
+        )
+        lines.append(
+            f"    {' '.join(sorted(_available_dict['boolean'][x]))}\n"
+        )
+
+    lines.append(
+        "  Winsize attributes (possible values: integers from 0 to 65535):"
     )
-    _settings_lines.append(
-        f"    {' '.join(sorted(_available_dict['boolean'][x]))}\n"
+    lines.append(
+        f"    {' '.join(sorted(_available_dict['winsize']))}\n"
     )
 
-_settings_lines.append(
-    "  Winsize attributes (possible values: any nonnegative integer):"
-)
-_settings_lines.append(
-    f"    {' '.join(sorted(_available_dict['winsize']))}\n"
-)
-
-_settings_lines.append(
-    "  Non-canonical mode-related attributes (possible values: "
-    "any nonnegative integer):"
-)
-_settings_lines.append(
-    f"    {' '.join(sorted(_available_dict['non_canonical']))}\n"
-)
+    lines.append(
+        "  Non-canonical mode-related attributes (possible values: "
+        "any nonnegative integer):"
+    )
+    lines.append(
+        f"    {' '.join(sorted(_available_dict['non_canonical']))}\n"
+    )
 
-_settings_lines.append("  CSIZE and *DLY attributes:")
-heading1 = "ATTRIBUTE"
-heading2 = "POSSIBLE VALUES"
-csize_key = "csize"
-csize_values = ", ".join(
-    sorted([f'stty.{v}, "{v}"' for v in _available_dict["csize"]])
-)
+    lines.append("  CSIZE and *DLY attributes:")
+    heading1 = "ATTRIBUTE"
+    heading2 = "POSSIBLE VALUES"
+    csize_key = "csize"
+    csize_values = ", ".join(
+        sorted([f'stty.{v}, "{v}"' for v in _available_dict["csize"]])
+    )
 
-padding = max(len(x) for x in _available_dict["delay_masks"])
-padding = max(padding, len(csize_key), len(heading1))
-
-# Print heading for the table.
-_settings_lines.append(f"    {heading1:^{padding}}  |  {heading2}")
-# Print the CSIZE row.
-_settings_lines.append(f"    {csize_key:^{padding}}  |  {csize_values}")
-# Print the *DLY rows.
-for mask, maskvalset in _available_dict["delay_masks"].items():
-    mask_values = ", ".join(sorted([f'stty.{v}, "{v}"' for v in maskvalset]))
-    _settings_lines.append(f"    {mask:^{padding}}  |  {mask_values}")
-
-_settings_lines.append("\n  Control character attributes:")
-_settings_lines.append(
-    "    ATTRIBUTES: "
-    + " ".join(sorted(_available_dict['control_character']))
-)
-_settings_lines.append(
-    f"""    POSSIBLE VALUES: a string or bytes object. If a string value is
+    padding = max(len(x) for x in _available_dict["delay_masks"])
+    padding = max(padding, len(csize_key), len(heading1))
+
+    # Print heading for the table.
+    lines.append(f"    {heading1:^{padding}}  |  {heading2}")
+    # Print the CSIZE row.
+    lines.append(f"    {csize_key:^{padding}}  |  {csize_values}")
+    # Print the *DLY rows.
+    for mask, maskvalset in _available_dict["delay_masks"].items():
+        mask_values = ", ".join(sorted([f'stty.{v}, "{v}"'
+                                        for v in maskvalset]))
+        lines.append(f"    {mask:^{padding}}  |  {mask_values}")
+
+    lines.append("\n  Control character attributes:")
+    lines.append(
+        "    ATTRIBUTES: "
+        + " ".join(sorted(_available_dict['control_character']))
+    )
+    lines.append(
+        f"""    POSSIBLE VALUES: a string or bytes object. If a string value is
                      used, then it must be a string of length 1, or
                      a string of length 2 staring with "^" (caret,
                      circumflex) to represent a control character,
@@ -827,26 +1079,18 @@ _settings_lines.append(
                      of stty(1) for more details. If a value of type
                      "bytes" is used, then it must be of length 1.
 """
-)
-
-_settings_lines.append("  Speed attributes:")
-_settings_lines.append(
-    f"    ATTRIBUTES: {' '.join(sorted(_available_dict['speed']))}"
-)
-_settings_lines.append(
-    "    POSSIBLE VALUES: "
-    + ", ".join([str(n) for n in sorted(_available_dict['baud_rates'])])
-)
+    )
 
-_settings_str = "\n".join(_settings_lines)
+    lines.append("  Speed attributes:")
+    lines.append(
+        f"    ATTRIBUTES: {' '.join(sorted(_available_dict['speed']))}"
+    )
+    lines.append(
+        "    POSSIBLE VALUES: "
+        + ", ".join([str(n) for n in sorted(_available_dict['baud_rates'])])
+    )
 
-def settings_help_str():
-    """Return help string about all
-    available Stty attributes and
-    their possible values on the
-    current platform.
-    """
-    return _settings_str
+    return "\n".join(lines)
 
 def settings_help():
     """Print help message about all
@@ -854,4 +1098,4 @@ def settings_help():
     their possible values on the
     current platform.
     """
-    print(_settings_str)
+    print(settings_help_str())
@@ -19,6 +19,9 @@ import os
 import string
 import tempfile
 import sys
+import copy
+import pickle
+import weakref
 
 printable_ascii_chars = [chr(char) for char in range(32, 127)]
 
@@ -460,6 +463,260 @@ def test_equality_attributes():
 
     return all_success_local
 
+# 23. Test that get() and repr() reflect attribute changes.
+def test_get_repr_after_set():
+    all_success_local = True
+
+    try:
+        tty = stty.Stty(fd=0)
+        orig = tty.echo
+        d = tty.get()
+        r = repr(tty)
+        d["echo"] = None # Must not affect tty.
+        assert tty.get()["echo"] == orig
+        tty.echo = not orig
+        assert tty.get()["echo"] == (not orig)
+        assert repr(tty) != r
+        tty.echo = orig
+        assert repr(tty) == r
+        print_result("test_get_repr_after_set", True)
+    except Exception as e:
+        print_result("test_get_repr_after_set", False)
+        all_success_local = False
+        print(e)
+
+    return all_success_local
+
+# 24. Test that save() without a path returns an independent copy.
+def test_save_copy():
+    all_success_local = True
+
+    try:
+        tty = stty.Stty(fd=0)
+        orig_echo = tty.echo
+        orig_intr = tty.intr
+        tty2 = tty.save()
+        assert tty2.get() == tty.get()
+        tty2.echo = not orig_echo
+        tty2.intr = "^X" if orig_intr != "^X" else "^C"
+        assert tty.echo == orig_echo and tty.intr == orig_intr
+        assert tty2.echo == (not orig_echo) and tty2.intr != orig_intr
+
+        class Sub(stty.Stty):
+            pass
+        assert type(Sub(fd=0).save()) is Sub
+        print_result("test_save_copy", True)
+    except Exception as e:
+        print_result("test_save_copy", False)
+        all_success_local = False
+        print(e)
+
+    return all_success_local
+
+# 25. Test that load() rejects files not written by save().
+def test_load_invalid():
+    all_success_local = True
+
+    try:
+        with tempfile.NamedTemporaryFile(delete=False) as tf:
+            path = tf.name
+        stty.Stty(fd=0).save(path)
+        with open(path, "rb") as f:
+            good = f.read()
+
+        # Offsets of the format version and the platform in the header.
+        version = 4
+        platform = 5
+        bad_files = [
+            b"not a saved Stty",
+            b'{"echo": true}', # Written by the earlier JSON-based save().
+            good[:version] + bytes([good[version] + 1]) + good[version + 1:],
+            good[:platform] + b"x" + good[platform + 1:],
+            good[:-1],
+        ]
+
+        for data in bad_files:
+            with open(path, "wb") as f:
+                f.write(data)
+            try:
+                stty.Stty(path=path)
+                all_success_local = False
+            except ValueError:
+                pass
+        os.unlink(path)
+        print_result("test_load_invalid", all_success_local)
+    except Exception as e:
+        print_result("test_load_invalid", False)
+        all_success_local = False
+        print(e)
+
+    return all_success_local
+
+# 26. Test that fromfd() discards attribute values set earlier.
+def test_fromfd_refresh():
+    all_success_local = True
+
+    try:
+        tty = stty.Stty(fd=0)
+        orig = tty.echo
+        tty.echo = not orig
+        tty.fromfd(0)
+        assert tty.echo == orig
+        assert tty.get() == stty.Stty(fd=0).get()
+        print_result("test_fromfd_refresh", True)
+    except Exception as e:
+        print_result("test_fromfd_refresh", False)
+        all_success_local = False
+        print(e)
+
+    return all_success_local
+
+# 27. Test value limits of save() and that a failed save()
+# leaves an existing file intact.
+def test_save_limits():
+    all_success_local = True
+
+    try:
+        tty = stty.Stty(fd=0)
+        if hasattr(tty, "rows"):
+            try:
+                tty.rows = 0x10000
+                assert False
+            except ValueError:
+                pass
+        with tempfile.NamedTemporaryFile(delete=False) as tf:
+            path = tf.name
+        tty.save(path)
+        tty.min = 0x100
+        try:
+            tty.save(path)
+            assert False
+        except ValueError:
+            pass
+        tty2 = stty.Stty(path=path)
+        os.unlink(path)
+        assert tty2.min != 0x100
+        print_result("test_save_limits", True)
+    except Exception as e:
+        print_result("test_save_limits", False)
+        all_success_local = False
+        print(e)
+
+    return all_success_local
+
+# 28. Test writes of values that an attribute already has and
+# of boolean masks with more than one bit such as CIBAUD.
+def test_set_unchanged():
+    all_success_local = True
+
+    try:
+        tty = stty.Stty(fd=0)
+        d = tty.get()
+        tty.set(**d)
+        assert tty.get() == d
+
+        if hasattr(stty.termios, "CIBAUD"):
+            mask = stty.termios.CIBAUD
+            low = mask & -mask # Lowest bit of the mask.
+            cflag = 2 # Index of cflag in the termios list.
+            tty.cibaud = False
+            tty._termios[cflag] |= low
+            tty.cibaud = True
+            assert (tty._termios[cflag] & mask) == mask
+            tty.cibaud = False
+            assert (tty._termios[cflag] & mask) == 0
+        print_result("test_set_unchanged", True)
+    except Exception as e:
+        print_result("test_set_unchanged", False)
+        all_success_local = False
+        print(e)
+
+    return all_success_local
+
+# 29. Test copy, deepcopy, pickle and weak references of Stty objects.
+def test_copy_pickle():
+    all_success_local = True
+
+    try:
+        tty = stty.Stty(fd=0)
+        tty.echo = not tty.echo
+        d = tty.get()
+        assert copy.copy(tty).get() == d
+        for tty2 in [copy.deepcopy(tty), pickle.loads(pickle.dumps(tty))]:
+            assert type(tty2) is stty.Stty
+            assert tty2.get() == d
+            assert tty2._termios == tty._termios
+            assert tty2._termios is not tty._termios
+            assert tty2._termios[-1] is not tty._termios[-1]
+        assert weakref.ref(tty)() is tty
+        print_result("test_copy_pickle", True)
+    except Exception as e:
+        print_result("test_copy_pickle", False)
+        all_success_local = False
+        print(e)
+
+    return all_success_local
+
+# 30. Test that raw() turns off all boolean iflag and lflag attributes.
+def test_raw():
+    all_success_local = True
+
+    try:
+        tty = stty.Stty(fd=0)
+        tty.get() # Fill the cache that raw() must drop.
+        tty.raw()
+        assert (tty._termios[stty._IFLAG] & stty._ifbool_mask) == 0
+        assert (tty._termios[stty._LFLAG] & stty._lfbool_mask) == 0
+        d = tty.get()
+        # An unpickled copy derives every attribute from _termios.
+        d2 = pickle.loads(pickle.dumps(tty)).get()
+        for flag in ["iflag", "lflag"]:
+            for name in stty.settings["boolean"][flag]:
+                assert d[name] == False and d2[name] == False
+        assert d["opost"] == False and d["csize"] == "cs8"
+        assert d["min"] == 1 and d["time"] == 0
+        print_result("test_raw", True)
+    except Exception as e:
+        print_result("test_raw", False)
+        all_success_local = False
+        print(e)
+
+    return all_success_local
+
+# 31. Test attribute access errors: unsupported names and
+# termios values that have no name.
+def test_getattr_errors():
+    all_success_local = True
+
+    try:
+        class Sub(stty.Stty):
+            pass
+        try:
+            Sub(fd=0).foobar
+            all_success_local = False
+        except AttributeError as e:
+            assert "'Sub'" in str(e)
+
+        tty = stty.Stty(fd=0)
+        # A speed constant without a baud rate, as with BOTHER on Linux.
+        tty._termios[stty._ISPEED] = max(stty._baud_d_inverse) + 1
+        for read in [lambda: tty.ispeed,
+                     lambda: hasattr(tty, "ispeed"),
+                     lambda: getattr(tty, "ispeed", None),
+                     tty.get]:
+            try:
+                read()
+                all_success_local = False
+            except ValueError:
+                pass
+        print_result("test_getattr_errors", all_success_local)
+    except Exception as e:
+        print_result("test_getattr_errors", False)
+        all_success_local = False
+        print(e)
+
+    return all_success_local
+
 # Run all tests.
 try:
     assert test_cc_conversion()
@@ -484,5 +741,14 @@ try:
     assert test_settings_dict()
     assert test_equality()
     assert test_equality_attributes()
+    assert test_get_repr_after_set()
+    assert test_save_copy()
+    assert test_load_invalid()
+    assert test_fromfd_refresh()
+    assert test_save_limits()
+    assert test_set_unchanged()
+    assert test_copy_pickle()
+    assert test_raw()
+    assert test_getattr_errors()
 except AssertionError:
     sys.exit(1)